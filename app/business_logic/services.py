@@ -1,24 +1,58 @@
 # Standard libraries
-from datetime import datetime, timedelta
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Optional
 
 # Third-party libraries
+import bcrypt
 import jwt
-from passlib.context import CryptContext
+from cachetools import TLRUCache
 from pydantic import EmailStr
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 # Modules
 from app.config import (
-    JWT_KEY as KEY,
+    JWT_KEY_BYTES as KEY,
     JWT_ALGORITHM as ALGORITHM,
     JWT_TOKEN_INVALIDATION_TIME as INVALIDATION_TIME,
-    PASSWORD_HASHING_ALGORITHM as PASS_ALGORITHM
+    JWT_CACHE_ITEM_LIMIT as TOKEN_CACHE_LIMIT,
+    PASSWORD_HASHING_ROUNDS as PASS_ROUNDS
 )
 from app.db import models, repositories
 from app.routing import schemas
 
 
+# Dedicated pool for CPU-bound password hashing, keeps the default threadpool free
+bcrypt_pool = ThreadPoolExecutor(max_workers = os.cpu_count())
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hashes a password with bcrypt using the configured cost factor.
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds = PASS_ROUNDS)).decode()
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    """
+    Checks a password against a bcrypt hash.
+    """
+    return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+
+def _needs_rehash(hashed_password: str) -> bool:
+    """
+    Checks if a bcrypt hash was made with a cost factor other than the configured one.
+
+    - reads the cost from the '$2b$NN$' hash prefix.
+    """
+    return int(hashed_password.split("$")[2]) != PASS_ROUNDS
+
+
 class User:
     """
     Service layer for user-related operations.
@@ -27,7 +61,9 @@ class User:
     - retrieves user based on email;
     - handles credentials verification.
     """
-    pwd_context = CryptContext(schemes = [PASS_ALGORITHM], deprecated = "auto")
+    # Verified against when the email is unknown, so both paths take the same time.
+    # Computing it at import also loads the bcrypt backend before the first request.
+    dummy_hash = _hash_password("!")
 
     def __init__(self, db: Session):
         """
@@ -35,19 +71,21 @@ class User:
         """
         self.repo = repositories.UserRepository(db = db)
 
-    def create_user(self, email: EmailStr, password: str) -> Optional[models.User]:
+    async def create_user(self, email: EmailStr, password: str) -> Optional[models.User]:
         """
         Creates a new user.
 
         - receives email and password;
         - checks if user with provided email exists;
-        - if not, hashes password and returns a UserModel object;
-        - returns None otherwise.
+        - if not, hashes password in the bcrypt pool and returns a UserModel object;
+        - returns None otherwise;
+        - database calls run in the threadpool, so they never block the event loop.
         """
-        if self.repo.get_by_email(email = email):
+        if await run_in_threadpool(self.repo.get_by_email, email = email):
             return None
-        hashed_pass = self.pwd_context.hash(password)
-        return self.repo.create(email = email, password = hashed_pass)
+        loop = asyncio.get_running_loop()
+        hashed_pass = await loop.run_in_executor(bcrypt_pool, _hash_password, password)
+        return await run_in_threadpool(self.repo.create, email = email, password = hashed_pass)
 
     def get_by_email(self, email: EmailStr) -> Optional[models.User]:
         """
@@ -55,18 +93,28 @@ class User:
         """
         return self.repo.get_by_email(email)
 
-    def verify_credentials(self, email: EmailStr, password: str) -> bool:
+    async def verify_credentials(self, email: EmailStr, password: str) -> Optional[models.User]:
         """
         Checks if the provided credentials are valid.
 
-        - retrieves user by email;
-        - compares provided password to the stored hash;
-        - returns True if valid, False otherwise.
-        """
-        user = self.get_by_email(email = email)
-        if not user:
-            return False
-        return self.pwd_context.verify(password, user.password)
+        - retrieves user by email in the threadpool;
+        - compares provided password to the stored hash in the bcrypt pool;
+        - runs the comparison against a dummy hash for unknown emails;
+        - rehashes the password if the stored hash uses a different cost factor;
+        - returns the UserModel object if valid, None otherwise.
+        """
+        user = await run_in_threadpool(self.repo.get_by_email, email = email)
+        target_hash = user.password if user else self.dummy_hash
+        loop = asyncio.get_running_loop()
+        is_valid = await loop.run_in_executor(
+            bcrypt_pool, _verify_password, password, target_hash
+        )
+        if not user or not is_valid:
+            return None
+        if _needs_rehash(user.password):
+            hashed_pass = await loop.run_in_executor(bcrypt_pool, _hash_password, password)
+            await run_in_threadpool(self.repo.update_password, user = user, password = hashed_pass)
+        return user
 
 
 class Post:
@@ -99,19 +147,25 @@ class Post:
         """
         return self.repo.get_by_id(post_id = post_id)
 
-    def get_list_of_posts(self, user_id: str) -> Optional[list[schemas.PostResponse]]:
+    def get_list_of_posts(self, user_id: str) -> list[schemas.PostResponse]:
         """
         Retrieves a list of posts by user ID.
 
-        - fetches all posts by user;
-        - maps each to PostResponse (excluding user_id).
+        - fetches ID and text of all posts by user;
+        - maps each to PostResponse (excluding user_id);
+        - skips per-row validation, since the rows come from the database.
         """
         list_of_posts = self.repo.get_list_by_user(user_id=user_id)
-        return [schemas.PostResponse(post_id = str(post.id), text = post.text) for post in list_of_posts]
+        return [
+            schemas.PostResponse.model_construct(post_id = post_id, text = text)
+            for post_id, text in list_of_posts
+        ]
 
-    def delete_post(self, post_id: str) -> bool:
+    def delete_post(self, post_id: str) -> Optional[models.Post]:
         """
         Deletes a post by its ID.
+
+        - returns the deleted PostModel object, or None if it did not exist.
         """
         return self.repo.delete(post_id = post_id)
 
@@ -124,6 +178,14 @@ class JWT:
     - validates a provided token;
     - extracts user_id from a token.
     """
+    # Decoded payloads keyed by raw token, each entry expires together with its token
+    _payload_cache = TLRUCache(
+        maxsize = TOKEN_CACHE_LIMIT,
+        ttu = lambda _token, payload, _now: payload.get("exp", 0),
+        timer = time.time
+    )
+    _payload_cache_lock = Lock()
+
     @staticmethod
     def create_token(data: dict) -> str:
         """
@@ -134,7 +196,7 @@ class JWT:
         - returns an encoded JWT using the configured key and algorithm.
         """
         data_to_encode = data.copy()
-        expire = datetime.now() + timedelta(seconds = INVALIDATION_TIME)
+        expire = int(time.time()) + INVALIDATION_TIME
         data_to_encode.update({"exp": expire})
         return jwt.encode(data_to_encode, KEY, algorithm = ALGORITHM)
 
@@ -143,14 +205,22 @@ class JWT:
         """
         Decodes a JWT token.
 
-        - uses configured key and algorithm;
+        - returns a cached payload if the token was already decoded and is not expired;
+        - otherwise uses configured key and algorithm and caches the result;
         - returns the decoded payload if successful;
         - returns None on error.
         """
+        with JWT._payload_cache_lock:
+            payload = JWT._payload_cache.get(token)
+        if payload is not None:
+            return payload
         try:
-            return jwt.decode(token, KEY, algorithms = [ALGORITHM])
+            payload = jwt.decode(token, KEY, algorithms = [ALGORITHM])
         except jwt.PyJWTError:
             return None
+        with JWT._payload_cache_lock:
+            JWT._payload_cache[token] = payload
+        return payload
 
     @staticmethod
     def validate_token(token: str) -> bool:
@@ -1,17 +1,34 @@
+# Standard libraries
+import os
+
+
 # JWT TOKEN CONFIGURATION
-# Encryption key
-JWT_KEY = (r"86QEo9,a&<_XWqv3fu`)x-n1^B'1y(r09tq>u5TvSr4!@x`vXk85:r0;((k*]Fw{&$,`_IfvC\!CJfBxc£@6,$VM3v]N%/cPsgrd"
-           r"9%5-5d'A24.r2bPEzl]M!=((C_0OyCS/f=~*4B5/miMk*m16*Yaxg)hk;cI06yhPUUMJeu}`8/8!#\5SW4YT1tx2`X5f'M^Mj^{S"
-           r"ZyZ+7`9lUAF:(1rdx£jW}e+opkM2\XgB44EGN60We];kCP_5wQ5&16BEb:A'HXtZEP-w41/1CzH?9>%1}?M!&b{jo2$XI@jw(;1}")
+# Encryption key, must be provided through the JWT_KEY environment variable
+JWT_KEY = os.getenv("JWT_KEY")
+if not JWT_KEY:
+    raise RuntimeError("JWT_KEY environment variable is not set")
+# Encryption key encoded once, so PyJWT does not encode it on every call
+JWT_KEY_BYTES = JWT_KEY.encode("utf-8")
 # Hashing algorithm
 JWT_ALGORITHM = "HS256"
 # Default invalidation time in seconds (3 hours)
 JWT_TOKEN_INVALIDATION_TIME = 60 * 60 * 3
+# Maximum number of decoded tokens kept in memory
+JWT_CACHE_ITEM_LIMIT = 4096
 
 
 # PASSWORD HASHING CONFIGURATION
-# Hasing algorithm
-PASSWORD_HASHING_ALGORITHM = "bcrypt"
+# Bcrypt cost factor, can be overridden with the BCRYPT_ROUNDS environment variable
+PASSWORD_HASHING_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+
+# DATABASE CONFIGURATION
+# Persistent connections kept in the pool
+DB_POOL_SIZE = 20
+# Extra connections allowed under load
+DB_MAX_OVERFLOW = 40
+# Connection lifetime in seconds, kept below MySQL wait_timeout
+DB_POOL_RECYCLE = 60 * 30
 
 
 # VALIDATION CONFIGURATION
@@ -1,18 +1,57 @@
 # Standatd libraries
+import os
+import time
 import uuid
 
 # Third-party libraries
-from sqlalchemy import Column, String, ForeignKey
-from sqlalchemy.dialects.mysql import VARCHAR, CHAR, TEXT
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.mysql import VARCHAR, BINARY, TEXT
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import TypeDecorator
 
 
 Base = declarative_base()
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Generates a time-ordered UUID (version 7, RFC 9562).
+
+    - 48-bit millisecond Unix timestamp followed by 74 random bits;
+    - new keys land near the end of the primary key index.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                                   # version
+    value |= ((random_bits >> 62) & 0xFFF) << 64         # rand_a
+    value |= 0b10 << 62                                  # variant
+    value |= random_bits & ((1 << 62) - 1)               # rand_b
+    return uuid.UUID(int = value)
+
+
+class UUIDBinary(TypeDecorator):
+    """Stores a UUID as BINARY(16) while exposing it as a canonical string."""
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes = value))
+
+
 class User(Base):
     """Represents a user with unique email and hashed password."""
     __tablename__ = "users"
-    id = Column(CHAR(36), primary_key = True, default = lambda: str(uuid.uuid4()))
+    id = Column(UUIDBinary, primary_key = True, default = lambda: str(uuid7()))
     email = Column(VARCHAR(255), unique = True, nullable = False)
     password = Column(String(255), nullable = False)
 
@@ -20,6 +59,7 @@ class User(Base):
 class Post(Base):
     """Represents a post with textual content. Post is linked to a user."""
     __tablename__ = "posts"
-    id = Column(CHAR(36), primary_key = True, default = lambda: str(uuid.uuid4()))
-    user_id = Column(CHAR(36), ForeignKey('users.id'), nullable = False)
+    __table_args__ = (Index("ix_posts_user_id", "user_id"),)
+    id = Column(UUIDBinary, primary_key = True, default = lambda: str(uuid7()))
+    user_id = Column(UUIDBinary, ForeignKey('users.id'), nullable = False)
     text = Column(TEXT, nullable = False)
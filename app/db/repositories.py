@@ -1,8 +1,10 @@
 # Standard libraries
-from typing import Optional
+import uuid
+from typing import Optional, Sequence
 
 # Third-party libraries
 from pydantic import EmailStr
+from sqlalchemy import Row, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 # Modules
@@ -15,7 +17,8 @@ class UserRepository:
 
     - fetches user by id;
     - fetches user by email;
-    - creates a new user.
+    - creates a new user;
+    - updates a user's password hash.
     """
     def __init__(self, db: Session):
         """
@@ -25,15 +28,26 @@ class UserRepository:
 
     def get_by_id(self, user_id: str) -> Optional[models.User]:
         """
-        Fetches the first user matching the given id.
+        Fetches the user with the given id.
+
+        - returns None for IDs that are not valid UUIDs;
+        - uses the session identity map before querying the database;
+        - returns User object if found, else None.
         """
-        return self.db.query(models.User).filter(models.User.id == user_id).first()
+        try:
+            user_id = str(uuid.UUID(user_id))
+        except ValueError:
+            return None
+        return self.db.get(models.User, user_id)
 
     def get_by_email(self, email: EmailStr) -> Optional[models.User]:
         """
         Fetches the first user mathing the given email.
+
+        - uses a lambda statement, so the SQL is compiled once and reused.
         """
-        return self.db.query(models.User).filter(models.User.email == email).first()
+        stmt = lambda_stmt(lambda: select(models.User).where(models.User.email == email))
+        return self.db.execute(stmt).scalars().first()
 
     def create(self, email: EmailStr, password: str) -> models.User:
         """
@@ -42,7 +56,14 @@ class UserRepository:
         user = models.User(email = email, password = password)
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
+        return user
+
+    def update_password(self, user: models.User, password: str) -> models.User:
+        """
+        Replaces the stored password hash of the given user.
+        """
+        user.password = password
+        self.db.commit()
         return user
 
 
@@ -69,33 +90,46 @@ class PostRepository:
         post = models.Post(user_id = user_id, text = text)
         self.db.add(post)
         self.db.commit()
-        self.db.refresh(post)
         return post
 
-    def get_list_by_user(self, user_id: str) -> Optional[list[models.Post]]:
+    def get_list_by_user(self, user_id: str) -> Sequence[Row[tuple[str, str]]]:
         """
-        Fetches all posts for a given user_id.
+        Fetches all posts for a given user_id, ordered by post ID.
+
+        - selects only post ID and text, returned as (id, text) rows;
+        - uses a lambda statement, so the SQL is compiled once and reused.
         """
-        return self.db.query(models.Post).filter(models.Post.user_id == user_id).all()
+        stmt = lambda_stmt(
+            lambda: select(models.Post.id, models.Post.text)
+            .where(models.Post.user_id == user_id)
+            .order_by(models.Post.id)
+        )
+        return self.db.execute(stmt).all()
 
     def get_by_id(self, post_id: str) -> Optional[models.Post]:
         """
         Fetches a post by its ID.
 
+        - returns None for IDs that are not valid UUIDs;
+        - uses the session identity map before querying the database;
         - returns Post object if found, else None.
         """
-        return self.db.query(models.Post).filter(models.Post.id == post_id).first()
+        try:
+            post_id = str(uuid.UUID(post_id))
+        except ValueError:
+            return None
+        return self.db.get(models.Post, post_id)
 
-    def delete(self, post_id: str) -> bool:
+    def delete(self, post_id: str) -> Optional[models.Post]:
         """
         Deletes a post by its ID.
 
-        - returns True if the post was deleted;
-        - returns False if no mathcing post was found.
+        - returns the deleted Post object;
+        - returns None if no mathcing post was found.
         """
         post = self.get_by_id(post_id = post_id)
         if not post:
-            return False
+            return None
         self.db.delete(post)
         self.db.commit()
-        return True
+        return post
@@ -1,7 +1,12 @@
+# Standard libraries
+from threading import Lock
+
 # Third-party libraries
+import orjson
 from cachetools import TTLCache
 from cachetools.keys import hashkey
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 # Modules
@@ -13,8 +18,10 @@ from app.config import (
 from app.db import setup
 from app.routing import schemas, dependencies
 
-router = APIRouter()
+router = APIRouter(default_response_class = ORJSONResponse)
 cache = TTLCache(maxsize = ITEM_LIMIT, ttl = TTL)
+# TTLCache is not thread-safe and sync endpoints run in a threadpool
+cache_lock = Lock()
 
 
 @router.post(
@@ -22,7 +29,7 @@ cache = TTLCache(maxsize = ITEM_LIMIT, ttl = TTL)
     status_code = status.HTTP_201_CREATED,
     response_model = schemas.SignUpResponse
 )
-def sign_up(request: schemas.SignUpRequest, db: Session = Depends(setup.get_db)):
+async def sign_up(request: schemas.SignUpRequest, db: Session = Depends(setup.get_db)):
     """
     Handles user registration.
 
@@ -31,22 +38,15 @@ def sign_up(request: schemas.SignUpRequest, db: Session = Depends(setup.get_db))
     - raises 400 if the email is already in use;
     - raises 500 on unexpected server error.
     """
-    try:
-        user_service = services.User(db = db)
-        user = user_service.create_user(request.email, request.password)
-        if not user:
-            raise HTTPException(
-                status_code = status.HTTP_400_BAD_REQUEST,
-                detail = "Email already registered"
-            )
-        token = services.JWT.create_token({"sub" : str(user.id)})
-        return {"access_token" : token}
-
-    except Exception:
+    user_service = services.User(db = db)
+    user = await user_service.create_user(request.email, request.password)
+    if not user:
         raise HTTPException(
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail = "Internal server error occurred"
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail = "Email already registered"
         )
+    token = services.JWT.create_token({"sub" : str(user.id)})
+    return {"access_token" : token}
 
 
 @router.post(
@@ -54,7 +54,7 @@ def sign_up(request: schemas.SignUpRequest, db: Session = Depends(setup.get_db))
     status_code = status.HTTP_200_OK,
     response_model = schemas.LoginResponse
 )
-def login(request: schemas.LoginRequest, db: Session = Depends(setup.get_db)):
+async def login(request: schemas.LoginRequest, db: Session = Depends(setup.get_db)):
     """
     Handles user login.
 
@@ -63,26 +63,18 @@ def login(request: schemas.LoginRequest, db: Session = Depends(setup.get_db)):
     - raises 401 if validation fails;
     - raises 500 on unexpected server error.
     """
-    try:
-        user_service = services.User(db = db)
-        is_valid = user_service.verify_credentials(
-            email = request.email,
-            password = request.password
-        )
-        if not is_valid:
-            raise HTTPException(
-                status_code = status.HTTP_401_UNAUTHORIZED,
-                detail = "Either email or password are incorrect"
-            )
-        user = user_service.get_by_email(email = request.email)
-        token = services.JWT.create_token({"sub": str(user.id)})
-        return {"access_token": token}
-
-    except Exception:
+    user_service = services.User(db = db)
+    user = await user_service.verify_credentials(
+        email = request.email,
+        password = request.password
+    )
+    if not user:
         raise HTTPException(
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail = "Internal server error occurred"
+            status_code = status.HTTP_401_UNAUTHORIZED,
+            detail = "Either email or password are incorrect"
         )
+    token = services.JWT.create_token({"sub": str(user.id)})
+    return {"access_token": token}
 
 
 @router.post(
@@ -103,24 +95,19 @@ def add_post(
     - validates payload size against configured limit, raises 413 if exceeded;
     - extracts user_id from the provided token;
     - saves the post text linked to user_id in the database;
+    - drops the cached list of posts of the user;
     - returns the ID of the newly created post;
     - raises 500 on unexpected server error.
     """
-    try:
-        post_service = services.Post(db = db)
-        user_id = services.JWT.get_user_id(token)
-        post = post_service.add_post(
-            user_id = user_id,
-            text = post.text
-        )
-        cache.clear()
-        return { "post_id" : post.id }
-
-    except Exception:
-        raise HTTPException(
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail = "Internal server error occurred"
-        )
+    post_service = services.Post(db = db)
+    user_id = services.JWT.get_user_id(token)
+    post = post_service.add_post(
+        user_id = user_id,
+        text = post.text
+    )
+    with cache_lock:
+        cache.pop(hashkey(user_id), None)
+    return { "post_id" : post.id }
 
 
 @router.get(
@@ -137,29 +124,24 @@ def get_list_of_posts(
 
     - validates JWT token in authorization headers, raises 403 if missing, 401 if invalid;
     - extracts user_id from the provided token;
-    - checks if response is stored in cache, returns it if it is;
+    - checks if serialized response is stored in cache, returns it if it is;
     - collects and returns a list of posts for the user_id;
     - each post is a dictionary with 'post_id' and 'text' fields;
-    - caches response;
+    - caches serialized response, so cache hits skip validation and serialization;
     - raises 500 on unexpected server error.
     """
-    try:
-        user_id = services.JWT.get_user_id(token)
-        key = hashkey(user_id)
-        if key in cache:
-            return cache[key]
+    user_id = services.JWT.get_user_id(token)
+    key = hashkey(user_id)
+    with cache_lock:
+        body = cache.get(key)
 
+    if body is None:
         post_service = services.Post(db = db)
         list_of_posts = post_service.get_list_of_posts(user_id = user_id)
-        response = { "list_of_posts" : list_of_posts }
-        cache[key] = response
-        return response
-
-    except Exception:
-        raise HTTPException(
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail = "Internal server error occurred"
-        )
+        body = orjson.dumps({ "list_of_posts" : [post.model_dump() for post in list_of_posts] })
+        with cache_lock:
+            cache[key] = body
+    return Response(content = body, media_type = "application/json")
 
 
 @router.post(
@@ -177,22 +159,17 @@ def delete_post(
 
     - validates JWT token in authorization headers, raises 403 if missing, 401 if invalid;
     - removes a post by the provided post_id, returns a success message;
+    - drops the cached list of posts of the post's owner;
     - raises 404 if no post matches the provided ID;
     - raises 500 on unexpected server error.
     """
-    try:
-        post_service = services.Post(db = db)
-        result = post_service.delete_post(post_id = post.id)
-        if not result:
-            raise HTTPException(
-                status_code = status.HTTP_404_NOT_FOUND,
-                detail = f"No post matching ID {post.id} was found."
-            )
-        cache.clear()
-        return {"success": f"post {post.id} was deleted."}
-
-    except Exception:
+    post_service = services.Post(db = db)
+    deleted_post = post_service.delete_post(post_id = post.id)
+    if not deleted_post:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error occurred"
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail = f"No post matching ID {post.id} was found."
         )
+    with cache_lock:
+        cache.pop(hashkey(deleted_post.user_id), None)
+    return {"success": f"post {post.id} was deleted."}
@@ -1,5 +1,6 @@
 # Third-party libraries
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 
 # Modules
 from app.db import setup
@@ -9,3 +10,17 @@ from app.routing import endpoints
 setup.init_db()
 app = FastAPI()
 app.include_router(endpoints.router)
+
+
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception):
+    """
+    Converts any unhandled exception into a 500 response.
+
+    - HTTPExceptions raised by endpoints are handled by FastAPI and never reach here;
+    - the exception is still re-raised by the server, so the traceback gets logged.
+    """
+    return JSONResponse(
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content = {"detail": "Internal server error occurred"}
+    )